@@ -1,6 +1,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -32,6 +33,7 @@ class ApiSettings(BaseSettings):
         env_file=None,  # Will be set at runtime
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,  # Hashable, so it can key cached singletons
     )
 
 
@@ -58,25 +60,38 @@ def get_api_settings() -> ApiSettings:
     env_name = env_setting.env
 
     base_dir = Path(__file__).resolve().parent.parent  # project root
-    env_file_path = os.path.join(base_dir, "environments", f"{env_name}.env")
-    # env_file_path = base_dir / "environments" / f"{env_name}.env"
+    env_dir = base_dir / "environments"
+
+    # Single directory read instead of probing each candidate file
+    try:
+        names = set(os.listdir(env_dir))
+    except FileNotFoundError:
+        names = set()
 
     # Fallback to dev.env if the specific environment file does not exist
-    if not os.path.exists(env_file_path):
-        fallback_path = os.path.join(base_dir, "environments", "dev.env")
-        if os.path.exists(fallback_path):
-            env_file_path = fallback_path
-        else:
-            raise FileNotFoundError(
-                f"No environment file found for '{env_name}' and no dev.env fallback. '{fallback_path}'"
-            )
+    if f"{env_name}.env" in names:
+        env_file_path = env_dir / f"{env_name}.env"
+    elif "dev.env" in names:
+        env_file_path = env_dir / "dev.env"
+    else:
+        raise FileNotFoundError(
+            f"No environment file found for '{env_name}' and no dev.env fallback. '{env_dir / 'dev.env'}'"
+        )
 
     # Instantiate ApiSettings dynamically from the chosen .env
     return ApiSettings(_env_file=env_file_path)  # type: ignore
 
 
 # -----------------------------
-# Load settings
+# Lazy settings (PEP 562)
 # -----------------------------
-env_settings: EnvSettings = get_env_setting()
-api_settings: ApiSettings = get_api_settings()
+def __getattr__(name: str) -> Any:
+    """
+    Resolve `api_settings` / `env_settings` on first access
+    instead of loading them at import time.
+    """
+    if name == "api_settings":
+        return get_api_settings()
+    if name == "env_settings":
+        return get_env_setting()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,23 @@
 import asyncio
 import threading
 import time
-from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncGenerator, Callable, Generator, Optional, cast
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+)
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Callable, Generator, Optional
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from src.logger.logger import logger
@@ -22,7 +33,7 @@ class Database:
     - Lazy engine/session creation
     - Context-managed sessions with auto commit/rollback
     - Connection pooling with automatic recycling and idle timeout
-    - Query-level statement timeout
+    - Connection-level statement timeout (set once at connect)
     - Retry logic for transient DB failures
     - Health check method
     """
@@ -31,7 +42,7 @@ class Database:
     _sync_engines: dict[str, create_engine] = {}
     _async_engines: dict[str, AsyncEngine] = {}
     _SyncSessions: dict[str, sessionmaker[Session]] = {}
-    _AsyncSessions: dict[str, sessionmaker[AsyncSession]] = {}
+    _AsyncSessions: dict[str, async_sessionmaker[AsyncSession]] = {}
 
     DEFAULT_POOL_SIZE = 5
     DEFAULT_MAX_OVERFLOW = 10
@@ -39,13 +50,33 @@ class Database:
     DEFAULT_POOL_RECYCLE = 1800  # recycle connections every 30 minutes
     DEFAULT_STATEMENT_TIMEOUT = 30  # seconds per query
     RETRY_COUNT = 3
-    RETRY_DELAY = 2  # seconds
+    RETRY_DELAY = 0.5  # seconds, base for exponential backoff
+    MAX_RETRY_DELAY = 4  # seconds
 
     def __init__(self, uri: str, engine_kwargs: Optional[dict] = None):
         self.uri = uri
         self.engine_kwargs = engine_kwargs or {}
         self._engine: Optional[create_engine | AsyncEngine] = None
         self._sessionmaker: Optional[sessionmaker] = None
+        self._async_sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+        self._sync_session_cb: Optional[
+            Callable[[], AbstractContextManager[Session]]
+        ] = None
+        self._async_session_cb: Optional[
+            Callable[[], AbstractAsyncContextManager[AsyncSession]]
+        ] = None
+
+    # -----------------------------
+    # Shared instance per URI
+    # -----------------------------
+    @classmethod
+    @lru_cache(maxsize=None)
+    def for_uri(cls, uri: str) -> "Database":
+        """
+        Return a process-wide Database instance for `uri`.
+        Once warm, session access skips engine setup and the class lock.
+        """
+        return cls(uri)
 
     # -----------------------------
     # Internal: detect sync/async from URI
@@ -56,13 +87,43 @@ class Database:
             "mysql+asyncmy"
         )
 
+    # -----------------------------
+    # Internal: retry backoff
+    # -----------------------------
+    @classmethod
+    def _backoff(cls, attempt: int) -> float:
+        """Exponential delay before retry `attempt` (1-based), capped."""
+        return float(min(cls.RETRY_DELAY * 2 ** (attempt - 1), cls.MAX_RETRY_DELAY))
+
+    # -----------------------------
+    # Internal: driver-level connect args
+    # -----------------------------
+    def _connect_args(self) -> dict[str, Any]:
+        """
+        Apply the statement timeout once per connection at connect time,
+        so session checkouts don't need a `SET statement_timeout` round-trip.
+        """
+        timeout_ms = str(self.DEFAULT_STATEMENT_TIMEOUT * 1000)
+        if self.uri.startswith("postgresql+asyncpg"):
+            return {"server_settings": {"statement_timeout": timeout_ms}}
+        if self.uri.startswith("postgresql"):
+            return {"options": f"-c statement_timeout={timeout_ms}"}
+        return {}
+
     # -----------------------------
     # Sync session property
     # -----------------------------
     @property
-    def get_sync(self) -> Callable[[], Generator[Session, None, None]]:
+    def get_sync(self) -> Callable[[], AbstractContextManager[Session]]:
+        """
+        Sync session factory. Connection retries sleep in the calling thread, so
+        never use it on the event loop; async code should use get_async
+        or run the whole unit of work via `anyio.to_thread.run_sync`.
+        """
         if self._is_async:
             raise RuntimeError("URI requires async engine. Use get_async instead.")
+        if self._sync_session_cb is not None:
+            return self._sync_session_cb
 
         def _ensure_engine():
             with self._lock:
@@ -73,6 +134,7 @@ class Database:
                         "pool_timeout": self.DEFAULT_POOL_TIMEOUT,
                         "pool_recycle": self.DEFAULT_POOL_RECYCLE,
                         "echo": False,
+                        "connect_args": self._connect_args(),
                     }
                     defaults.update(self.engine_kwargs)
                     engine = create_engine(self.uri, future=True, **defaults)
@@ -87,42 +149,44 @@ class Database:
 
         @contextmanager
         def _session() -> Generator[Session, None, None]:
+            # Retry only the connection checkout; the caller's block runs once
             attempt = 0
-            while attempt < self.RETRY_COUNT:
+            while True:
                 session: Session = self._sessionmaker()
                 try:
-                    session.execute(
-                        text(
-                            f"SET statement_timeout = {self.DEFAULT_STATEMENT_TIMEOUT * 1000}"
-                        )
-                    )
-                    yield session
-                    session.commit()
+                    session.connection()
                     break
                 except OperationalError as e:
-                    session.rollback()
+                    session.close()
                     attempt += 1
                     logger.warning(
                         f"DB OperationalError, retry {attempt}/{self.RETRY_COUNT}: {e}"
                     )
-                    time.sleep(self.RETRY_DELAY)
                     if attempt >= self.RETRY_COUNT:
                         raise
-                except Exception:
-                    session.rollback()
-                    raise
-                finally:
-                    session.close()
+                    time.sleep(self._backoff(attempt))
 
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        self._sync_session_cb = _session
         return _session
 
     # -----------------------------
     # Async session property
     # -----------------------------
     @property
-    def get_async(self) -> Callable[[], AsyncGenerator[AsyncSession, None]]:
+    def get_async(self) -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
         if not self._is_async:
             raise RuntimeError("URI does not support async. Use get_sync instead.")
+        if self._async_session_cb is not None:
+            return self._async_session_cb
 
         def _ensure_engine():
             with self._lock:
@@ -133,48 +197,49 @@ class Database:
                         "pool_timeout": self.DEFAULT_POOL_TIMEOUT,
                         "pool_recycle": self.DEFAULT_POOL_RECYCLE,
                         "echo": False,
+                        "connect_args": self._connect_args(),
                     }
                     defaults.update(self.engine_kwargs)
                     engine = create_async_engine(self.uri, future=True, **defaults)
                     self._async_engines[self.uri] = engine
-                    self._AsyncSessions[self.uri] = cast(
-                        sessionmaker[AsyncSession],
-                        sessionmaker(
-                            bind=engine, class_=AsyncSession, expire_on_commit=False
-                        ),
+                    self._AsyncSessions[self.uri] = async_sessionmaker(
+                        bind=engine, expire_on_commit=False
                     )
                 self._engine = self._async_engines[self.uri]
-                self._sessionmaker = self._AsyncSessions[self.uri]
+                self._async_sessionmaker = self._AsyncSessions[self.uri]
 
         _ensure_engine()
+        factory = self._async_sessionmaker
 
         @asynccontextmanager
         async def _session() -> AsyncGenerator[AsyncSession, None]:
+            # Retry only the connection checkout; the caller's block runs once
             attempt = 0
-            while attempt < self.RETRY_COUNT:
-                async with self._sessionmaker() as session:
-                    try:
-                        await session.execute(
-                            text(
-                                f"SET statement_timeout = {self.DEFAULT_STATEMENT_TIMEOUT * 1000}"
-                            )
-                        )
-                        yield session
-                        await session.commit()
-                        break
-                    except OperationalError as e:
-                        await session.rollback()
-                        attempt += 1
-                        logger.warning(
-                            f"Async DB OperationalError, retry {attempt}/{self.RETRY_COUNT}: {e}"
-                        )
-                        await asyncio.sleep(self.RETRY_DELAY)
-                        if attempt >= self.RETRY_COUNT:
-                            raise
-                    except Exception:
-                        await session.rollback()
+            while True:
+                session = factory()
+                try:
+                    await session.connection()
+                    break
+                except OperationalError as e:
+                    await session.close()
+                    attempt += 1
+                    logger.warning(
+                        f"Async DB OperationalError, retry {attempt}/{self.RETRY_COUNT}: {e}"
+                    )
+                    if attempt >= self.RETRY_COUNT:
                         raise
+                    await asyncio.sleep(self._backoff(attempt))
 
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
+        self._async_session_cb = _session
         return _session
 
     # -----------------------------
@@ -193,6 +258,30 @@ class Database:
             raise RuntimeError("Cannot drop tables in async mode")
         Base.metadata.drop_all(self._engine)
 
+    # -----------------------------
+    # Pool warm-up
+    # -----------------------------
+    async def warm_up_async(self) -> None:
+        """
+        Open one pooled connection and return it to the pool, so the first
+        request skips the connect handshake. Failures are logged, not raised.
+        """
+        try:
+            async with self.get_async() as session:
+                await session.connection()
+        except (SQLAlchemyError, OSError) as e:
+            # asyncpg surfaces refused connections as bare OSError
+            logger.warning(f"DB warm-up failed: {e}")
+
+    # -----------------------------
+    # Pool shutdown
+    # -----------------------------
+    async def dispose_async(self) -> None:
+        """Close pooled connections of the async engine, if created."""
+        engine = self._async_engines.get(self.uri)
+        if engine is not None:
+            await engine.dispose()
+
     # -----------------------------
     # Health check
     # -----------------------------
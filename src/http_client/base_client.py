@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 from aiohttp import ClientTimeout, FormData
 from aiohttp_retry import ExponentialRetry, RetryClient
 
@@ -8,6 +9,11 @@ class HTTPClientError(Exception):
     """Custom exception for HTTP client errors."""
 
 
+def _json_dumps(obj: Any) -> str:
+    # aiohttp expects a str serializer; orjson returns bytes
+    return orjson.dumps(obj).decode()
+
+
 class HTTPClient:
     def __init__(
         self,
@@ -17,9 +23,31 @@ class HTTPClient:
         retries: int = 3,
     ):
         self.base_url = base_url.rstrip("/")
+        self._base_prefix = self.base_url + "/"
         self.headers = headers or {}
         self.timeout = ClientTimeout(total=timeout)
         self.retry_options = ExponentialRetry(attempts=retries)
+        self._session: Optional[RetryClient] = None
+
+    async def _get_session(self) -> RetryClient:
+        """
+        Lazily create a single long-lived RetryClient so the
+        underlying connection pool is reused across requests.
+        """
+        if self._session is None:
+            self._session = RetryClient(
+                timeout=self.timeout,
+                retry_options=self.retry_options,
+                raise_for_status=False,
+                json_serialize=_json_dumps,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying session. Call on application shutdown."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def _request(
         self,
@@ -31,35 +59,32 @@ class HTTPClient:
         data: dict | FormData | None = None,
         headers: dict | None = None,
     ):
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        merged_headers = {**self.headers, **(headers or {})}
-
-        async with RetryClient(
-            timeout=self.timeout,
-            retry_options=self.retry_options,
-            raise_for_status=False,
-        ) as session:
-            async with session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_body,
-                data=data,
-                headers=merged_headers,
-            ) as response:
-
-                if response.status >= 400:
-                    text = await response.text()
-                    raise HTTPClientError(
-                        f"{method} {url} failed with status {response.status}: {text}"
-                    )
-
-                content_type = response.headers.get("Content-Type", "")
-
-                if "application/json" in content_type:
-                    return await response.json()
-
-                return await response.text()
+        url = self._base_prefix + path.lstrip("/")
+        # Only copy default headers when per-call headers are given
+        merged_headers = {**self.headers, **headers} if headers else self.headers
+
+        session = await self._get_session()
+        async with session.request(
+            method=method,
+            url=url,
+            params=params,
+            json=json_body,
+            data=data,
+            headers=merged_headers,
+        ) as response:
+
+            if response.status >= 400:
+                text = await response.text()
+                raise HTTPClientError(
+                    f"{method} {url} failed with status {response.status}: {text}"
+                )
+
+            content_type = response.headers.get("Content-Type", "")
+
+            if "application/json" in content_type:
+                return await response.json(loads=orjson.loads)
+
+            return await response.text()
 
     # ---------- Public Methods ----------
 
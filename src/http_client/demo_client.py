@@ -1,13 +1,18 @@
+from functools import lru_cache
+
 from src.http_client.base_client import HTTPClient
 
 
 class DemoClient:
-    def __init__(self):
+    def __init__(self) -> None:
         self.client = HTTPClient(
             base_url="http://localhost:8080",
             headers={"Authorization": "Bearer token"},
         )
 
+    async def close(self) -> None:
+        await self.client.close()
+
     async def create_user(self) -> dict:
         try:
             result = await self.client.post("/users", data={"name": ""})
@@ -15,3 +20,9 @@ class DemoClient:
         except Exception as e:
             # TODO need to replace with logger
             print(f"Error occurred demoClient:create_user: {e}")
+
+
+@lru_cache(maxsize=1)
+def get_demo_client() -> DemoClient:
+    """Shared DemoClient so its connection pool is reused by all callers."""
+    return DemoClient()
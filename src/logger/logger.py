@@ -1,60 +1,40 @@
 import logging
-from threading import Lock
-from typing import Optional
 
 
-class _Logger:
+def _build_logger(name: str = "app") -> logging.Logger:
     """
-    Thread-safe Singleton Logger.
-    Single instance across project.
-    Supports dynamic log level changes.
+    Build the project logger.
+    Called once at import; module imports already make it a singleton.
     Prevents duplicate handlers.
     """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
 
-    _instance: Optional["_Logger"] = None
-    _lock: Lock = Lock()
+    # Prevent duplicate handlers
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setLevel(logging.INFO)
 
-    def __new__(cls, name: str = "app") -> "_Logger":
-        with cls._lock:
-            if cls._instance is None:
-                instance = super().__new__(cls)
-                instance._initialized = False
-                cls._instance = instance
-            return cls._instance
+        formatter = logging.Formatter(
+            "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+        )
+        handler.setFormatter(formatter)
 
-    def __init__(self, name: str = "app") -> None:
-        # Prevent re-initialization in singleton
-        if self._initialized:
-            return
+        logger.addHandler(handler)
+        logger.propagate = False
 
-        self._initialized: bool = True
-        self.logger: logging.Logger = logging.getLogger(name)
-        self.logger.setLevel(logging.INFO)
+    return logger
 
-        # Prevent duplicate handlers
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setLevel(logging.INFO)
 
-            formatter = logging.Formatter(
-                "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-            )
-            handler.setFormatter(formatter)
-
-            self.logger.addHandler(handler)
-            self.logger.propagate = False
-
-    def get_logger(self) -> logging.Logger:
-        return self.logger
-
-    def set_level(self, level: int) -> None:
-        self.logger.setLevel(level)
-        for handler in self.logger.handlers:
-            handler.setLevel(level)
+def set_level(level: int) -> None:
+    """Change log level of the project logger and its handlers."""
+    logger.setLevel(level)
+    for handler in logger.handlers:
+        handler.setLevel(level)
 
 
 # ------------------------
 # Single importable logger
 # ------------------------
 
-logger: logging.Logger = _Logger().get_logger()
+logger: logging.Logger = _build_logger()
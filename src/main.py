@@ -1,37 +1,95 @@
-from typing import Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
 
-from fastapi import FastAPI, Request, Response
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 from mangum import Mangum
+from starlette.routing import Route
 
+from src.config import get_api_settings
+from src.database.database import Database
+from src.http_client.demo_client import get_demo_client
 from src.middleware import Middleware
 from src.routers import routers
+from src.utils.responses import ORJSONResponse
 
-app = FastAPI(version="1.0.0", title="FastAPI", docs_url="/docs", redoc_url="/redoc")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Shared HTTP clients keep their connection pool for the app lifetime
+    demo_client = get_demo_client()
+    # Open the first pooled DB connection before serving requests
+    database = Database.for_uri(get_api_settings().demo_database_url)
+    await database.warm_up_async()
+    try:
+        yield
+    finally:
+        await demo_client.close()
+        await database.dispose_async()
+
+
+app = FastAPI(
+    version="1.0.0",
+    title="FastAPI",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 
 # TODO add middleware
 
 
-# Wrap responses only for /api routes
-@app.middleware("http")
+# Global exception handler
+async def api_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    return await Middleware.error_handler(request, exc)
+
+
+# -----------------------------
+# /api sub-application
+# -----------------------------
+# Response wrapping lives on the mounted app, so non-/api requests
+# (docs, health, etc) never enter the wrap middleware.
+api_app = FastAPI(
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    default_response_class=ORJSONResponse,
+)
+
+
+@api_app.middleware("http")
 async def api_response_middleware(
     request: Request, call_next: Callable[[Request], Awaitable[Response]]
 ) -> Response:
-    path: str = request.scope["path"]
+    return await Middleware.wrap_response(request, call_next)
 
-    if path.startswith("/api"):
-        return await Middleware.wrap_response(request, call_next)
 
-    return await call_next(request)
+api_app.add_exception_handler(Exception, api_exception_handler)
+api_app.include_router(routers)
 
+app.mount("/api", api_app)
+# Mount only matches "/api/..."; route the bare prefix into the sub-app too so it
+# gets the wrapped 404 instead of a slash redirect
+app.router.routes.append(Route("/api", api_app, include_in_schema=False))
 
-# Global exception handler
-@app.exception_handler(Exception)
-async def api_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    return await Middleware.error_handler(request, exc)
+
+# Mounted apps are not part of the parent schema; publish /api routes
+# through the root /docs instead of exposing a wrapped /api/openapi.json
+def api_openapi() -> dict[str, Any]:
+    if app.openapi_schema is None:
+        schema_router = APIRouter()
+        schema_router.include_router(routers, prefix="/api")
+        app.openapi_schema = get_openapi(
+            title=app.title,
+            version=app.version,
+            routes=[*app.routes, *schema_router.routes],
+        )
+    return app.openapi_schema
 
 
-app.include_router(routers)
+app.openapi = api_openapi  # type: ignore[method-assign]
 
 handler = Mangum(app)
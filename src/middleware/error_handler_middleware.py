@@ -1,5 +1,3 @@
-import traceback
-
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
@@ -19,7 +17,7 @@ async def error_handler_middleware(request: Request, exc: Exception) -> JSONResp
 
     # DB unique constraint, FK violation, etc
     if isinstance(exc, IntegrityError):
-        logger.warning(f"IntegrityError: {exc}")
+        logger.warning("IntegrityError: %s", exc)
         return JSONResponse(
             status_code=409,
             content={"success": False, "error": "Resource already exists"},
@@ -27,7 +25,7 @@ async def error_handler_middleware(request: Request, exc: Exception) -> JSONResp
 
     # Other SQLAlchemy errors
     if isinstance(exc, SQLAlchemyError):
-        logger.error(f"SQLAlchemyError: {exc}\n{traceback.format_exc()}")
+        logger.error("SQLAlchemyError: %s", exc, exc_info=exc)
         return JSONResponse(
             status_code=500,
             content={"success": False, "error": "Database error"},
@@ -41,7 +39,7 @@ async def error_handler_middleware(request: Request, exc: Exception) -> JSONResp
         )
 
     # Fallback
-    logger.error(f"Unhandled Exception: {exc}\n{traceback.format_exc()}")
+    logger.error("Unhandled Exception: %s", exc, exc_info=exc)
     return JSONResponse(
         status_code=500,
         content={"success": False, "error": "Internal server error"},
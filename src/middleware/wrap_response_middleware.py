@@ -1,37 +1,28 @@
 import json
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable
 
 from fastapi import Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse, Response
-from pydantic import BaseModel
 
+from src.utils.responses import ORJSONResponse
 
-class APIResponse(BaseModel):
-    success: bool
-    data: Optional[Any] = None
-    error: Optional[str] = None
+# First byte of any JSON value we can splice into the envelope as-is
+_JSON_VALUE_START = frozenset(b'{["-0123456789tf')
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dict, excluding `error` if success."""
-        d = super().model_dump(exclude_none=True)
-        if d.get("success") and "error" in d:
-            d.pop("error")
-        return d
 
-
-def success_response(data: Any = None, status_code: int = 200) -> JSONResponse:
-    return JSONResponse(
-        content=jsonable_encoder(APIResponse(success=True, data=data).to_dict()),
-        status_code=status_code,
-    )
+def success_response(data: Any = None, status_code: int = 200) -> ORJSONResponse:
+    content: dict[str, Any] = {"success": True}
+    if data is not None:
+        content["data"] = data
+    return ORJSONResponse(content=content, status_code=status_code)
 
 
-def error_response(error: str, status_code: int = 400) -> JSONResponse:
-    return JSONResponse(
-        content=jsonable_encoder(APIResponse(success=False, error=error).to_dict()),
-        status_code=status_code,
-    )
+def error_response(error: str, status_code: int = 400) -> ORJSONResponse:
+    content: dict[str, Any] = {"success": False}
+    if error is not None:
+        content["error"] = error
+    return ORJSONResponse(content=content, status_code=status_code)
 
 
 async def wrap_response_middleware(
@@ -52,9 +43,21 @@ async def wrap_response_middleware(
     # Safely read body
     body_data: Any = None
     if hasattr(response, "body_iterator"):
-        body_bytes = b""
+        chunks: list[bytes] = []
         async for chunk in response.body_iterator:
-            body_bytes += chunk
+            chunks.append(chunk)
+        body_bytes = b"".join(chunks)
+
+        # Body is already JSON: splice the raw bytes into the envelope
+        # instead of parsing and re-serializing the whole payload
+        stripped = body_bytes.lstrip()
+        if stripped and stripped[0] in _JSON_VALUE_START:
+            return Response(
+                content=b'{"success":true,"data":' + body_bytes + b"}",
+                status_code=getattr(response, "status_code", 200),
+                media_type="application/json",
+            )
+
         try:
             body_text = body_bytes.decode()
             body_data = jsonable_encoder(json.loads(body_text))
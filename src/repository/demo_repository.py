@@ -1,24 +1,36 @@
+from functools import lru_cache
 from typing import Optional
 
-from sqlalchemy import delete, select
+from sqlalchemy import RowMapping, delete, insert, select
+from sqlalchemy.orm import load_only
 
-from src.config import ApiSettings, api_settings
+from src.config import ApiSettings, get_api_settings
 from src.database.database import Database
 from src.models.demo_model import DemoUserModel
-from src.schemas.demo_schema import DemoUserCreate
+from src.schemas.demo_schema import DemoUserCreate, DemoUserRecord
+
+# Only the columns DemoUserRecord exposes are loaded on list queries
+_DEMO_USER_RECORD_COLUMNS = tuple(
+    getattr(DemoUserModel, field) for field in DemoUserRecord.model_fields
+)
 
 
 class DemoRepository:
-    def __init__(self, settings: ApiSettings = api_settings):
-        self.connection = Database(settings.demo_database_url).get_async
+    def __init__(self, settings: Optional[ApiSettings] = None):
+        self._settings = settings or get_api_settings()
+        self.connection = Database.for_uri(self._settings.demo_database_url).get_async
 
     async def create_demo_user(self, payload: DemoUserCreate) -> DemoUserModel:
-        demo_user_model = DemoUserModel(**payload.model_dump())
+        # RETURNING fetches server-generated columns in the same round-trip
+        stmt = (
+            insert(DemoUserModel)
+            .values(**payload.model_dump())
+            .returning(DemoUserModel)
+        )
         async with self.connection() as session:
-            session.add(demo_user_model)
+            result = await session.execute(stmt)
             await session.commit()
-            await session.refresh(demo_user_model)
-            return demo_user_model
+            return result.scalar_one()
 
     async def get_demo_user(self, user_id: int) -> Optional[DemoUserModel]:
         async with self.connection() as session:
@@ -26,11 +38,29 @@ class DemoRepository:
             result = await session.execute(query)
             return result.scalar_one_or_none()
 
-    async def demo_user_all(self) -> list[DemoUserModel]:
+    async def get_demo_users(self, user_ids: list[int]) -> list[DemoUserModel]:
+        if not user_ids:
+            return []
         async with self.connection() as session:
-            query = select(DemoUserModel).order_by(DemoUserModel.id)
+            # One round-trip for the whole batch instead of one per id
+            query = (
+                select(DemoUserModel)
+                .options(load_only(*_DEMO_USER_RECORD_COLUMNS))
+                .where(DemoUserModel.id.in_(user_ids))
+                .order_by(DemoUserModel.id)
+            )
             result = await session.execute(query)
-            return result.scalars().all()
+            return list(result.scalars().all())
+
+    async def demo_user_all(self) -> list[RowMapping]:
+        """
+        DemoUserRecord columns as plain mappings, ordered by id.
+        Skips ORM instance hydration; callers serialize the rows directly.
+        """
+        async with self.connection() as session:
+            query = select(*_DEMO_USER_RECORD_COLUMNS).order_by(DemoUserModel.id)
+            result = await session.execute(query)
+            return list(result.mappings().all())
 
     async def update_demo_user(self, user_id: int):
         async with self.connection():
@@ -45,3 +75,9 @@ class DemoRepository:
             result = await session.execute(stmt)
             await session.commit()
             return bool(result.rowcount > 0)
+
+
+@lru_cache(maxsize=None)
+def get_demo_repository(settings: ApiSettings) -> DemoRepository:
+    """Shared DemoRepository per settings, reused across requests."""
+    return DemoRepository(settings)
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from src.controller.demo_controller import router as demo_user_router
 
-routers = APIRouter(prefix="/api")
+# Mounted under /api in src/main.py
+routers = APIRouter()
 
 routers.include_router(demo_user_router)
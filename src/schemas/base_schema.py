@@ -1,5 +1,6 @@
 from pydantic import BaseModel as PDBaseSchema
+from pydantic import ConfigDict
 
 
 class BaseSchema(PDBaseSchema):
-    pass
+    model_config = ConfigDict(from_attributes=True)
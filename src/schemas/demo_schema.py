@@ -7,6 +7,8 @@ from pydantic import EmailStr, Field, field_validator
 from src.schemas.base_schema import BaseSchema
 from src.utils.constant import BD_PHONE_REGEX
 
+_BD_PHONE_RE = re.compile(BD_PHONE_REGEX)
+
 
 class DemoUserBase(BaseSchema):
     email: Optional[EmailStr] = Field(
@@ -20,8 +22,10 @@ class DemoUserBase(BaseSchema):
 
     @field_validator("contact_number")
     @classmethod
-    def validate_bd_phone(cls, value: str) -> str:
-        if not re.match(BD_PHONE_REGEX, value):
+    def validate_bd_phone(cls, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return value
+        if not _BD_PHONE_RE.match(value):
             raise ValueError(
                 "Invalid Bangladesh phone number. Use format: +8801XXXXXXXXX or 01XXXXXXXXX"
             )
@@ -1,8 +1,10 @@
 # For adding service common code
-from src.config import ApiSettings, api_settings
+from typing import Optional
+
+from src.config import ApiSettings, get_api_settings
 
 
 class BaseService:
-    def __init__(self, settings: ApiSettings = api_settings):
+    def __init__(self, settings: Optional[ApiSettings] = None) -> None:
 
-        self.settings = settings
+        self.settings: ApiSettings = settings or get_api_settings()
@@ -1,31 +1,64 @@
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Final, Iterable, Mapping, Optional, cast
 
+import orjson
 from fastapi import Request
 
-from src.config import ApiSettings, api_settings
+from src.config import ApiSettings, get_api_settings
 from src.database.database import Base as BaseModel
-from src.repository.demo_repository import DemoRepository
+from src.repository.demo_repository import DemoRepository, get_demo_repository
 from src.schemas.demo_schema import DemoUserCreate, DemoUserRecord
 from src.service.base_service import BaseService
+from src.utils.helpers import get_auth_token
+
+# Shared read-only delete results, no per-call dict allocation
+_DELETED_TRUE: Final[Mapping[str, bool]] = MappingProxyType({"deleted": True})
+_DELETED_FALSE: Final[Mapping[str, bool]] = MappingProxyType({"deleted": False})
+
+# DemoUserRecord fields, read straight off ORM rows (skips _sa_instance_state)
+_DEMO_USER_FIELDS = tuple(DemoUserRecord.model_fields)
+
+
+def _make_record_builder(
+    fields: tuple[str, ...],
+) -> Callable[[BaseModel], DemoUserRecord]:
+    """
+    Generate `_build(m)` that reads each field from the row's __dict__
+    and calls model_construct with plain keyword arguments, avoiding a
+    per-row dict comprehension. Built once at import from the schema.
+    """
+    kwargs = ", ".join(f"{field}=values[{field!r}]" for field in fields)
+    source = (
+        "def _build(model):\n"
+        "    values = model.__dict__\n"
+        f"    return construct({kwargs})\n"
+    )
+    namespace: dict[str, Any] = {"construct": DemoUserRecord.model_construct}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return cast(Callable[[BaseModel], DemoUserRecord], namespace["_build"])
+
+
+_build_record = _make_record_builder(_DEMO_USER_FIELDS)
 
 
 class DemoService(BaseService):
 
     def __init__(
-        self, settings: ApiSettings = api_settings, auth_token: Optional[str] = None
+        self, settings: Optional[ApiSettings] = None, auth_token: Optional[str] = None
     ) -> None:
         super().__init__(settings=settings)
-        self.auth_token = auth_token
-        self.repository = DemoRepository(settings)
+        self.auth_token: Optional[str] = auth_token
+        self.repository: DemoRepository = get_demo_repository(self.settings)
 
     @classmethod
-    def get_instance(cls, request: Request) -> "DemoService":
-        auth_token = request.headers.get("Authorization", None)
-        return cls(settings=api_settings, auth_token=auth_token)
+    def model_to_details(cls, model: BaseModel) -> DemoUserRecord:
+        # Rows come from the DB and are already trusted; skip validation
+        return _build_record(model)
 
     @classmethod
-    def model_to_details(cls, model: BaseModel) -> DemoUserRecord:
-        return DemoUserRecord(**model.__dict__)
+    def models_to_details(cls, models: Iterable[BaseModel]) -> list[DemoUserRecord]:
+        # Call the builder directly: no per-row classmethod lookup on list paths
+        return [_build_record(model) for model in models]
 
     async def create_demo_user(self, payload: DemoUserCreate) -> DemoUserRecord:
         user_model = await self.repository.create_demo_user(payload)
@@ -35,9 +68,19 @@ class DemoService(BaseService):
         user_model = await self.repository.get_demo_user(user_id)
         return self.model_to_details(user_model)
 
-    async def demo_user_all(self) -> list[DemoUserRecord]:
-        models = await self.repository.demo_user_all()
-        return list(map(self.model_to_details, models))
+    async def demo_user_all(self) -> bytes:
+        """
+        All demo users pre-serialized to JSON bytes, for routes that
+        return them directly and skip response-model validation.
+        Reads plain column rows; no ORM or DemoUserRecord objects are built.
+        """
+        rows = await self.repository.demo_user_all()
+        # OPT_UTC_Z keeps datetimes in the same format as Pydantic-serialized routes
+        return orjson.dumps([dict(row) for row in rows], option=orjson.OPT_UTC_Z)
+
+    async def get_demo_users(self, user_ids: list[int]) -> list[DemoUserRecord]:
+        models = await self.repository.get_demo_users(user_ids)
+        return self.models_to_details(models)
 
     async def update_demo_user(self, user_id: int) -> None:
         pass
@@ -45,6 +88,11 @@ class DemoService(BaseService):
     async def patch_demo_user(self, user_id: int) -> None:
         pass
 
-    async def delete_demo_user(self, user_id: int) -> dict[str, bool]:
+    async def delete_demo_user(self, user_id: int) -> Mapping[str, bool]:
         result = await self.repository.delete_demo_user(user_id)
-        return {"deleted": result}
+        return _DELETED_TRUE if result else _DELETED_FALSE
+
+
+def get_demo_service(request: Request) -> DemoService:
+    """FastAPI dependency; resolved once per request and cached by FastAPI."""
+    return DemoService(settings=get_api_settings(), auth_token=get_auth_token(request))
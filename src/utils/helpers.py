@@ -0,0 +1,13 @@
+from typing import Optional, cast
+
+from fastapi import Request
+
+
+def get_auth_token(request: Request) -> Optional[str]:
+    """
+    Read the Authorization header once per request.
+    Cached on `request.state` so every service built for the request reuses it.
+    """
+    if not hasattr(request.state, "auth_token"):
+        request.state.auth_token = request.headers.get("Authorization", None)
+    return cast(Optional[str], request.state.auth_token)